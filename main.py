@@ -1,12 +1,10 @@
 import logging
 import os
 from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup
-from telegram.ext import Application, CommandHandler, CallbackQueryHandler, MessageHandler, filters, CallbackContext
-import requests
-from bs4 import BeautifulSoup
-from datetime import datetime
-from animal_facts import animals
+from telegram.constants import MessageLimit
+from telegram.ext import AIORateLimiter, Application, CommandHandler, CallbackQueryHandler, MessageHandler, filters, CallbackContext
 from dotenv import load_dotenv
+from wiki_client import AsyncWikiClient
 
 logging.basicConfig(
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
@@ -15,60 +13,40 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 load_dotenv()
-WIKIPEDIA_BASE_URL = "https://ru.wikipedia.org"
-
-def get_animal_info(animal_name):
-    search_url = f"{WIKIPEDIA_BASE_URL}/w/index.php"
-    params = {"search": animal_name, "title": "Special:Search", "go": "Go"}
-    response = requests.get(search_url, params=params)
-    if response.status_code != 200:
-        logger.error(f"Ошибка при запросе страницы: {response.status_code}")
-        return None
-    soup = BeautifulSoup(response.text, 'html.parser')
-    summary_paragraphs = soup.find_all('p', limit=4)
-    summary = ' '.join([p.get_text(strip=True) for p in summary_paragraphs])
-    og_image_tag = soup.find('meta', property='og:image')
-    image = og_image_tag['content'] if og_image_tag else None
-    info = {
-        "summary": summary,
-        "url": response.url,
-        "image": image,
-        "title": soup.find('h1', id="firstHeading").get_text(strip=True)
-    }
-    return info
-
-def get_animal_of_the_day():
-    day_of_month = datetime.now().day - 1
-    animal = animals[day_of_month]
-    search_url = f"{WIKIPEDIA_BASE_URL}/w/index.php"
-    params = {"search": animal['name'], "title": "Special:Search", "go": "Go"}
-    response = requests.get(search_url, params=params)
-    if response.status_code != 200:
-        logger.error(f"Ошибка при запросе страницы: {response.status_code}")
-        return None
-    soup = BeautifulSoup(response.text, 'html.parser')
-    og_image_tag = soup.find('meta', property='og:image')
-    image = og_image_tag['content'] if og_image_tag else None
-    info = {
-        "name": animal['name'],
-        "fact": animal['fact'],
-        "image": image,
-        "url": response.url
-    }
-    return info
+TELEGRAM_RATE_LIMIT = 25
+CONCURRENT_UPDATES = 32
+WEBHOOK_URL = os.getenv('WEBHOOK_URL')
+WEBHOOK_PORT = int(os.getenv('WEBHOOK_PORT', 8443))
+WEBHOOK_SECRET = os.getenv('WEBHOOK_SECRET')
+WEBHOOK_MAX_CONNECTIONS = 40
+START_TEXT = 'Привет! Я ЗооИнфо бот. Выберите, что вы хотите искать:'
+START_MARKUP = InlineKeyboardMarkup([
+    [
+        InlineKeyboardButton("Поиск по названию животного", callback_data='search_animal'),
+        InlineKeyboardButton("Поиск по названию породы", callback_data='search_breed')
+    ]
+])
+
+async def post_init(application: Application) -> None:
+    wiki_client = AsyncWikiClient()
+    await wiki_client.start()
+    application.bot_data['wiki_client'] = wiki_client
+
+async def post_shutdown(application: Application) -> None:
+    wiki_client = application.bot_data.pop('wiki_client', None)
+    if wiki_client:
+        await wiki_client.close()
+
+async def reply_with_image(message, image, text):
+    if image and len(text) <= MessageLimit.CAPTION_LENGTH:
+        await message.reply_photo(photo=image, caption=text, parse_mode='Markdown')
+        return
+    if image:
+        await message.reply_photo(photo=image)
+    await message.reply_text(text, parse_mode='Markdown')
 
 async def start(update: Update, context: CallbackContext) -> None:
-    keyboard = [
-        [
-            InlineKeyboardButton("Поиск по названию животного", callback_data='search_animal'),
-            InlineKeyboardButton("Поиск по названию породы", callback_data='search_breed')
-        ]
-    ]
-    reply_markup = InlineKeyboardMarkup(keyboard)
-    await update.message.reply_text(
-        'Привет! Я ЗооИнфо бот. Выберите, что вы хотите искать:',
-        reply_markup=reply_markup
-    )
+    await update.message.reply_text(START_TEXT, reply_markup=START_MARKUP)
 
 async def button(update: Update, context: CallbackContext) -> None:
     query = update.callback_query
@@ -81,24 +59,20 @@ async def button(update: Update, context: CallbackContext) -> None:
         await query.edit_message_text(text="Введите название породы:")
 
 async def handle_message(update: Update, context: CallbackContext) -> None:
-    user_input = update.message.text.strip().title()
+    user_input = update.message.text.strip()
     if context.user_data.get('search_type') in ['animal', 'breed']:
-        info = get_animal_info(user_input)
+        info = await context.bot_data['wiki_client'].get_animal(user_input)
         if info:
             response = f"**Название**: *{info['title']}*\n\n{info['summary']}\n\nЧитать больше: {info['url']}"
-            if info['image']:
-                await update.message.reply_photo(photo=info['image'])
-            await update.message.reply_text(response, parse_mode='Markdown')
+            await reply_with_image(update.message, info['image'], response)
         else:
             await update.message.reply_text('Извините, я не нашел информацию об этом животном.')
 
 async def animal_of_the_day(update: Update, context: CallbackContext) -> None:
-    info = get_animal_of_the_day()
+    info = await context.bot_data['wiki_client'].get_animal_of_the_day()
     if info:
         response = f"**Животное дня**: *{info['name']}*\n\nИнтересный факт: {info['fact']}\n\nЧитать больше: {info['url']}"
-        if info['image']:
-            await update.message.reply_photo(photo=info['image'])
-        await update.message.reply_text(response, parse_mode='Markdown')
+        await reply_with_image(update.message, info['image'], response)
     else:
         await update.message.reply_text('Извините, не удалось получить информацию о животном дня.')
 
@@ -108,12 +82,32 @@ def main() -> None:
         logger.error("Токен бота не указан. Проверьте файл .env.")
         return
     try:
-        application = Application.builder().token(TOKEN).build()
+        application = (
+            Application.builder()
+            .token(TOKEN)
+            .concurrent_updates(CONCURRENT_UPDATES)
+            .rate_limiter(AIORateLimiter(overall_max_rate=TELEGRAM_RATE_LIMIT, overall_time_period=1))
+            .post_init(post_init)
+            .post_shutdown(post_shutdown)
+            .build()
+        )
         application.add_handler(CommandHandler("start", start))
         application.add_handler(CallbackQueryHandler(button))
         application.add_handler(MessageHandler(filters.TEXT & ~filters.COMMAND, handle_message))
         application.add_handler(CommandHandler("animaloftheday", animal_of_the_day))
-        application.run_polling(allowed_updates=Update.ALL_TYPES, stop_signals=None)
+        if WEBHOOK_URL:
+            application.run_webhook(
+                listen="0.0.0.0",
+                port=WEBHOOK_PORT,
+                url_path=TOKEN,
+                webhook_url=f"{WEBHOOK_URL.rstrip('/')}/{TOKEN}",
+                max_connections=WEBHOOK_MAX_CONNECTIONS,
+                secret_token=WEBHOOK_SECRET,
+                allowed_updates=Update.ALL_TYPES,
+                stop_signals=None
+            )
+        else:
+            application.run_polling(allowed_updates=Update.ALL_TYPES, stop_signals=None)
     except Exception as e:
         logger.error(f"Ошибка при запуске бота: {e}")
 
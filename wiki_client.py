@@ -0,0 +1,135 @@
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from datetime import datetime
+from urllib.parse import quote
+import aiohttp
+import orjson
+from animal_facts import animals
+
+logger = logging.getLogger(__name__)
+
+WIKIPEDIA_BASE_URL = "https://ru.wikipedia.org"
+HTTP_TIMEOUT = 5
+HTTP_HEADERS = {
+    "User-Agent": "ZooInfoBot/1.0 (https://github.com/elgijb/zoobot)",
+    "Accept-Encoding": "gzip, deflate"
+}
+HTTP_POOL_LIMIT = 20
+DNS_CACHE_TTL = 300
+CACHE_MAXSIZE = 1024
+CACHE_TTL = 3600
+CACHE_NEGATIVE_TTL = 300
+
+class WikiError(Exception):
+    pass
+
+class AsyncWikiClient:
+    def __init__(self, base_url=WIKIPEDIA_BASE_URL, cache_maxsize=CACHE_MAXSIZE,
+                 cache_ttl=CACHE_TTL, negative_ttl=CACHE_NEGATIVE_TTL):
+        self.base_url = base_url
+        self.cache_maxsize = cache_maxsize
+        self.cache_ttl = cache_ttl
+        self.negative_ttl = negative_ttl
+        self.session = None
+        self.cache = OrderedDict()
+        self.pending = {}
+        self.animal_of_the_day_cache = None
+
+    async def start(self):
+        connector = aiohttp.TCPConnector(limit=HTTP_POOL_LIMIT, ttl_dns_cache=DNS_CACHE_TTL)
+        self.session = aiohttp.ClientSession(
+            connector=connector,
+            headers=HTTP_HEADERS,
+            timeout=aiohttp.ClientTimeout(total=HTTP_TIMEOUT)
+        )
+
+    async def close(self):
+        if self.session:
+            await self.session.close()
+            self.session = None
+
+    async def get_page_summary(self, title):
+        summary_url = f"{self.base_url}/api/rest_v1/page/summary/{quote(title.replace(' ', '_'), safe='')}"
+        try:
+            async with self.session.get(summary_url) as response:
+                if response.status == 404:
+                    return None
+                if response.status != 200:
+                    raise WikiError(f"HTTP {response.status}")
+                return orjson.loads(await response.read())
+        except (aiohttp.ClientError, asyncio.TimeoutError, orjson.JSONDecodeError) as e:
+            raise WikiError(e) from e
+
+    async def search_title(self, query):
+        params = {"action": "opensearch", "search": query, "limit": 1, "redirects": "resolve", "format": "json"}
+        try:
+            async with self.session.get(f"{self.base_url}/w/api.php", params=params) as response:
+                if response.status != 200:
+                    raise WikiError(f"HTTP {response.status}")
+                data = orjson.loads(await response.read())
+        except (aiohttp.ClientError, asyncio.TimeoutError, orjson.JSONDecodeError) as e:
+            raise WikiError(e) from e
+        if isinstance(data, list) and len(data) > 1 and data[1]:
+            return data[1][0]
+        return None
+
+    async def get_animal(self, animal_name):
+        key = animal_name.strip().lower()
+        entry = self.cache.get(key)
+        if entry and entry[0] > time.monotonic():
+            self.cache.move_to_end(key)
+            return entry[1]
+        task = self.pending.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self.fetch_animal(key, animal_name))
+            self.pending[key] = task
+            task.add_done_callback(lambda _: self.pending.pop(key, None))
+        return await asyncio.shield(task)
+
+    async def fetch_animal(self, key, animal_name):
+        info = None
+        try:
+            data = await self.get_page_summary(animal_name)
+            if not data:
+                title = await self.search_title(animal_name)
+                if title:
+                    data = await self.get_page_summary(title)
+        except WikiError as e:
+            logger.error(f"Ошибка при запросе страницы: {e}")
+            return None
+        if data:
+            info = {
+                "summary": data["extract"],
+                "url": data["content_urls"]["desktop"]["page"],
+                "image": data.get("thumbnail", {}).get("source"),
+                "title": data.get("titles", {}).get("normalized", data["title"])
+            }
+        ttl = self.cache_ttl if info is not None else self.negative_ttl
+        self.cache[key] = (time.monotonic() + ttl, info)
+        self.cache.move_to_end(key)
+        while len(self.cache) > self.cache_maxsize:
+            self.cache.popitem(last=False)
+        return info
+
+    async def get_animal_of_the_day(self, day=None):
+        day = day or datetime.now().date()
+        if self.animal_of_the_day_cache and self.animal_of_the_day_cache[0] == day:
+            return self.animal_of_the_day_cache[1]
+        animal = animals[day.day - 1]
+        try:
+            data = await self.get_page_summary(animal['name'])
+        except WikiError as e:
+            logger.error(f"Ошибка при запросе страницы: {e}")
+            return None
+        if not data:
+            return None
+        info = {
+            "name": animal['name'],
+            "fact": animal['fact'],
+            "image": data.get("thumbnail", {}).get("source"),
+            "url": data["content_urls"]["desktop"]["page"]
+        }
+        self.animal_of_the_day_cache = (day, info)
+        return info